@@ -1,29 +1,123 @@
 import argparse
-import importlib
+import asyncio
+import functools
+import hashlib
+import importlib.util
+import inspect
+import os
+import re
+import select
+import shutil
+import signal
 import subprocess
 import tempfile
+import threading
+import time
+import traceback
+from itertools import zip_longest
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 
 from tqdm import tqdm
 
 STD = 'c++17'
+BASE_FLAGS = ("-g", f"-std={STD}", "-O2")
+CHECK_FLAGS = (
+    "-fsanitize=address,undefined", "-fno-sanitize-recover=all",
+    "-Wall", "-Werror", "-Wsign-compare"
+)
+CACHE_DIR = Path.home() / '.cache' / 'algotests'
+RESULTS_DIR = CACHE_DIR / 'results'
+CACHE_MAX_BINARIES = 32
+CACHE_MAX_RESULTS = 10000
+_BLANKS = re.compile(r'\n\s*\n')
+WATCH_DEBOUNCE = 0.2
+WAIT_POLL_INTERVAL = 0.001
+# Python игнорирует эти сигналы, а subprocess (restore_signals=True) возвращал их детям
+SPAWN_DEFAULT_SIGNALS = tuple(
+    getattr(signal, name) for name in ('SIGPIPE', 'SIGXFZ', 'SIGXFSZ') if hasattr(signal, name)
+)
+STOP_POLL_INTERVAL = 0.05
+
+
+def _build_key(cpp_path: Path, flags: Tuple[str, ...]):
+    # Как в ccache: ключ зависит от исходника, флагов и версии компилятора
+    compiler_version = subprocess.run(
+        ["g++", "--version"],
+        capture_output=True,
+        check=False
+    ).stdout
+
+    key = hashlib.sha256(cpp_path.read_bytes())
+    key.update(b'\0'.join(flag.encode() for flag in flags))
+    key.update(compiler_version)
+    return key.hexdigest()
+
+
+def _link_or_copy(src: Path, dst: Path):
+    try:
+        os.link(src, dst)
+    except FileExistsError:
+        pass
+    except OSError:
+        tmp_path = dst.with_name(f'{dst.name}.{os.getpid()}.tmp')
+        shutil.copy2(src, tmp_path)
+        os.replace(tmp_path, dst)
+
+
+def _prune_cache(cache_dir: Path, max_entries: int):
+    # Оставляем только последние записи: mtime обновляется и при попадании в кеш
+    entries = [entry for entry in os.scandir(cache_dir) if entry.is_file()]
+    entries.sort(key=lambda entry: entry.stat().st_mtime_ns, reverse=True)
+    for entry in entries[max_entries:]:
+        try:
+            os.unlink(entry.path)
+        except FileNotFoundError:
+            pass
+
+
+def _flags_match(flags_path: Path, flags: Tuple[str, ...]):
+    try:
+        return flags_path.read_text() == ' '.join(flags)
+    except FileNotFoundError:
+        return False
 
 
-def compile(task_path: Path, skip_compiler_checks: bool=False):
+def compile(task_path: Path, skip_compiler_checks: bool=False, use_cache: bool=True):
     print('Compiling...')
     cpp_path = task_path / 'main.cpp'
     bin_path = task_path / 'main'
-    if skip_compiler_checks:
-        exit_code = subprocess.run(
-            [f"g++ {str(cpp_path)} -g -std={STD} -O2 -o {str(bin_path)}"],
-            shell=True
-        ).returncode
-    else:
-        exit_code = subprocess.run(
-            [f"g++ {str(cpp_path)} -fsanitize=address,undefined -g -fno-sanitize-recover=all -std={STD} -O2 -Wall -Werror -Wsign-compare -o {str(bin_path)}"],
-            shell=True
-        ).returncode
+    flags_path = task_path / 'main.flags'
+    flags = BASE_FLAGS if skip_compiler_checks else BASE_FLAGS + CHECK_FLAGS
+
+    if not cpp_path.exists():
+        print(f"File '{cpp_path}' was not found.")
+        return False
+
+    # Самая дешёвая проверка: бинарник новее исходника и собран с теми же флагами
+    if (
+        use_cache
+        and bin_path.exists()
+        and cpp_path.stat().st_mtime_ns <= bin_path.stat().st_mtime_ns
+        and _flags_match(flags_path, flags)
+    ):
+        print('Binary is up to date')
+        return True
+
+    cached_bin_path = CACHE_DIR / _build_key(cpp_path, flags)
+    if use_cache and cached_bin_path.exists():
+        bin_path.unlink(missing_ok=True)
+        _link_or_copy(cached_bin_path, bin_path)
+        # Обновляем mtime, чтобы следующий запуск прошёл быструю проверку
+        os.utime(bin_path)
+        flags_path.write_text(' '.join(flags))
+        print('Using cached binary')
+        return True
+
+    # Удаляем старый бинарник, а не перезаписываем его: он может быть жёсткой ссылкой на кеш
+    bin_path.unlink(missing_ok=True)
+    argv = ["g++", str(cpp_path), *flags, "-o", str(bin_path)]
+    exit_code = subprocess.run(argv, check=False).returncode
 
     if exit_code != 0:
         print(f'Compilation error. Exit code {exit_code}')
@@ -32,37 +126,148 @@ def compile(task_path: Path, skip_compiler_checks: bool=False):
     if not bin_path.exists():
         print('Compiling failed')
         return False
-    
+
+    if use_cache:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _link_or_copy(bin_path, cached_bin_path)
+        _prune_cache(CACHE_DIR, CACHE_MAX_BINARIES)
+    flags_path.write_text(' '.join(flags))
+
     return True
 
 
 def get_tests(task_path: Path):
     tests_dir = task_path / 'tests'
-    tests = []
     if not tests_dir.exists():
         print("Directory 'tests' was not found.")
-        return tests
-    
-    for test in tests_dir.iterdir():
-        if 'test' in test.name:
-            tests.append(test)
-    tests.sort(key=lambda x: int(str(x).split('_')[1]))
-    return tests
+        return []
+
+    # DirEntry уже знает тип файла, а номер теста вычисляем один раз
+    with os.scandir(tests_dir) as it:
+        tests = [
+            (int(entry.name.split('_')[1]), Path(entry.path))
+            for entry in it if entry.is_dir() and 'test' in entry.name
+        ]
+    tests.sort()
+    return [test for _, test in tests]
+
+
+def _default_checker(out_lines: List[str], true_out_lines: List[str]):
+    return out_lines == true_out_lines
+
+
+@functools.lru_cache(maxsize=None)
+def _load_checker(checker_path: str, mtime_ns: int):
+    spec = importlib.util.spec_from_file_location("custom_checker", checker_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    # Импорт функции checker
+    return getattr(module, "checker")
 
 
 def get_checker(task_path: Path):
     custom_checker_path = task_path / 'checker.py'
     if not custom_checker_path.exists():
-        return lambda out_lines, true_out_lines: '\n'.join(out_lines) == '\n'.join(true_out_lines)
-    else:
-        print('Using custom checker:', custom_checker_path)
-    
-        module_name = "custom_checker"
-        module = importlib.machinery.SourceFileLoader(module_name, str(custom_checker_path.absolute())).load_module()
+        return _default_checker
+
+    print('Using custom checker:', custom_checker_path)
+    return _load_checker(
+        str(custom_checker_path.absolute()),
+        custom_checker_path.stat().st_mtime_ns
+    )
 
-        # Импорт функции checker
-        checker = getattr(module, "checker")
-        return checker
+
+def _nonblank_lines(fp):
+    return filter(None, (line.strip() for line in fp))
+
+
+def _read_lines(path: str):
+    # read_text переводит \r и \r\n в \n, поэтому split('\n') делит строки
+    # так же, как итерация по файлу в _same
+    return list(_nonblank_lines(Path(path).read_text().split('\n')))
+
+
+def _same(out_fp, true_out_fp):
+    for line, true_line in zip_longest(_nonblank_lines(out_fp), _nonblank_lines(true_out_fp)):
+        if line != true_line:
+            return False
+    return True
+
+
+def _spawn(bin_path: str, input_file: str, output_file: str):
+    # posix_spawn сам перенаправляет stdin/stdout, без Popen и его обвязки
+    return os.posix_spawn(
+        bin_path,
+        [bin_path],
+        os.environ,
+        file_actions=[
+            (os.POSIX_SPAWN_OPEN, 0, input_file, os.O_RDONLY, 0),
+            (os.POSIX_SPAWN_OPEN, 1, output_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644),
+        ],
+        setsigdef=SPAWN_DEFAULT_SIGNALS
+    )
+
+
+def _spawn_error_path(error: OSError, input_file: str, output_file: str):
+    # posix_spawn приписывает бинарнику и ошибки открытия input.txt и файла вывода
+    if not os.access(input_file, os.R_OK):
+        return input_file
+    output_dir = os.path.dirname(output_file) or '.'
+    if os.path.exists(output_file):
+        if not os.access(output_file, os.W_OK):
+            return output_file
+    elif not os.access(output_dir, os.W_OK | os.X_OK):
+        return output_file
+    return error.filename
+
+
+def _pidfd_open(pid: int):
+    # pidfd есть только в Linux 5.3+, на остальных системах ждём через waitpid
+    if not hasattr(os, 'pidfd_open'):
+        return None
+    try:
+        return os.pidfd_open(pid)
+    except OSError:
+        return None
+
+
+def _kill(pid: int, pidfd):
+    try:
+        if pidfd is not None:
+            # Сигнал через pidfd не может попасть в чужой процесс с тем же pid
+            signal.pidfd_send_signal(pidfd, signal.SIGKILL)
+        else:
+            os.kill(pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+def _wait(pid: int, time_limit: float, stop: threading.Event=None):
+    # Дедлайн отсчитывается от запуска процесса и не зависит от загрузки event loop
+    deadline = time.monotonic() + time_limit
+    pidfd = _pidfd_open(pid)
+    try:
+        while True:
+            waited_pid, status = os.waitpid(pid, os.WNOHANG)
+            if waited_pid:
+                return os.waitstatus_to_exitcode(status)
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or (stop is not None and stop.is_set()):
+                # Не оставляем процесс работать после TL или остановки тестирования
+                _kill(pid, pidfd)
+                os.waitpid(pid, 0)
+                return None
+
+            if pidfd is not None:
+                # Просыпаемся сразу после завершения процесса
+                select.select([pidfd], [], [], min(remaining, STOP_POLL_INTERVAL))
+            else:
+                time.sleep(min(remaining, WAIT_POLL_INTERVAL))
+    finally:
+        if pidfd is not None:
+            os.close(pidfd)
 
 
 def test_case(
@@ -72,55 +277,215 @@ def test_case(
     output_file: str,
     true_output_file: str,
     checker,
-    time_limit: float=1.0
+    time_limit: float=1.0,
+    stop: threading.Event=None
 ):
     bin_path = test_path.parent.parent / 'main'
 
     if verbose:
         print('\n', 'Running ', test_path.stem, sep='')
         print('Input:')
-        with open(input_file, 'r') as fp:
-            print(
-                '\n'.join([
-                    line.strip() for line in fp.readlines() if line.strip() != ''
-                ]), '\n'
-            )
+        print(_BLANKS.sub('\n', Path(input_file).read_text()).strip(), '\n')
 
     try:
-        exit_code = subprocess.run(
-            [f"./{bin_path} <{input_file} >{output_file}"],
-            shell=True,
-            timeout=time_limit
-        ).returncode
-    except subprocess.TimeoutExpired:
+        pid = _spawn(str(bin_path.absolute()), input_file, output_file)
+    except OSError as error:
+        failed_path = _spawn_error_path(error, input_file, output_file)
+        return 'RE', f'Runtime error. Cannot run {test_path.stem}: {error.strerror}: {failed_path}'
+    exit_code = _wait(pid, time_limit, stop)
+    if exit_code is None:
         if verbose:
             print(f'Time limit exceeded ({time_limit}s)')
-        return 'TL'
+        return 'TL', None
 
     if exit_code != 0:
         if verbose:
             print(f'Runtime error. Exit code {exit_code}')
-        return 'RE'
-
-    with open(output_file, 'r') as out, open(true_output_file, 'r') as true_out:
-        out_lines = [line.strip() for line in out if line.strip() != '']
-        true_out_lines = [line.strip() for line in true_out if line.strip() != '']
-
-        if not checker(out_lines, true_out_lines):
-            print(f'Error in {test_path.stem} occurred')
-            print('Your answer:')
-            print('\n'.join(out_lines), '\n')
-            if exit_code == 0:
-                print('Real answer')
-                print('\n'.join(true_out_lines), '\n')
-                print('-' * 20)
-            return 'WA'
-        
-        if verbose:
-            print('Output:')
-            print('\n'.join(true_out_lines))
-            print('-' * 20)
-        return 'OK'
+        return 'RE', None
+
+    out_lines = true_out_lines = None
+    if checker is _default_checker:
+        # Сравниваем построчно и останавливаемся на первом расхождении
+        with open(output_file, 'r') as out, open(true_output_file, 'r') as true_out:
+            accepted = _same(out, true_out)
+    else:
+        out_lines = _read_lines(output_file)
+        true_out_lines = _read_lines(true_output_file)
+        accepted = checker(out_lines, true_out_lines)
+
+    if not accepted or verbose:
+        # Списки строк нужны только для печати, читаем их не больше одного раза
+        if out_lines is None:
+            out_lines = _read_lines(output_file)
+            true_out_lines = _read_lines(true_output_file)
+
+    if not accepted:
+        # Отчёт печатает вызывающий код: при параллельном запуске нужен только один
+        report = '\n'.join([
+            f'Error in {test_path.stem} occurred',
+            'Your answer:',
+            '\n'.join(out_lines) + ' \n',
+            'Real answer',
+            '\n'.join(true_out_lines) + ' \n',
+            '-' * 20
+        ])
+        return 'WA', report
+
+    if verbose:
+        print('Output:')
+        print('\n'.join(true_out_lines))
+        print('-' * 20)
+    return 'OK', None
+
+
+def _results_key(bin_path: Path, checker, time_limit: float):
+    # Вердикт зависит от бинарника, чекера и TL
+    key = hashlib.sha256(bin_path.read_bytes())
+    if checker is not _default_checker:
+        key.update(Path(inspect.getfile(checker)).read_bytes())
+    key.update(str(time_limit).encode())
+    return key
+
+
+def _cached_result_path(results_key, test: Path):
+    key = results_key.copy()
+    for file_name in ('input.txt', 'output.txt'):
+        key.update(hashlib.sha256((test / file_name).read_bytes()).digest())
+    return RESULTS_DIR / key.hexdigest()
+
+
+async def _run_tests(
+    tests: List[Path],
+    checker,
+    verbose: bool,
+    dry_run: bool,
+    time_limit: float,
+    use_cache: bool
+):
+    passed = set()
+
+    # Кешируем только OK: при ошибке нужно заново показать вывод программы.
+    # В verbose режиме вывод нужен всегда, поэтому кеш не используется
+    results_key = None
+    if use_cache and not verbose and tests:
+        results_key = _results_key(tests[0].parent.parent / 'main', checker, time_limit)
+        RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+
+    # Каждый тест - отдельный дочерний процесс, поэтому их можно запускать параллельно.
+    # Два ядра оставляем свободными, чтобы система оставалась отзывчивой.
+    # В verbose режиме тесты идут последовательно, чтобы вывод не перемешивался.
+    semaphore = asyncio.Semaphore(1 if verbose else max(1, (os.cpu_count() or 1) - 2))
+    stop = threading.Event()
+    started = set()
+
+    def run_test_blocking(test: Path, output_file: str):
+        if stop.is_set():
+            return None, None
+
+        cached_result_path = None
+        if results_key is not None:
+            try:
+                cached_result_path = _cached_result_path(results_key, test)
+            except OSError:
+                # Без input.txt или output.txt тест не кешируется, ошибку сообщит test_case
+                pass
+            if cached_result_path is not None and cached_result_path.exists():
+                try:
+                    os.utime(cached_result_path)
+                except FileNotFoundError:
+                    pass
+                return 'OK', None
+
+        test_result, report = test_case(
+            test,
+            verbose,
+            str(test / 'input.txt'),
+            output_file,
+            str(test / 'output.txt'),
+            checker,
+            time_limit,
+            stop
+        )
+
+        if test_result == 'OK' and cached_result_path is not None:
+            cached_result_path.write_text(test_result)
+        return test_result, report
+
+    failure = None
+
+    async def run_test(index: int, test: Path, output_file: str):
+        nonlocal failure
+        # Ожидание процесса, чекер и чтение файлов идут в отдельном потоке,
+        # чтобы обработка одного теста не влияла на вердикт другого
+        async with semaphore:
+            # Тесты после уже найденной ошибки не влияют на вердикт
+            if failure is not None and index > failure[0]:
+                return index, test, None, None
+
+            # Между захватом семафора и запуском потока нет await, отметка не опоздает
+            started.add(index)
+            test_result, report = await asyncio.to_thread(run_test_blocking, test, output_file)
+
+            # Запоминаем ошибку до освобождения семафора, чтобы следующий тест её уже видел
+            failed = test_result not in ('OK', None)
+            if failed and not dry_run and (failure is None or index < failure[0]):
+                failure = (index, test, test_result, report)
+        return index, test, test_result, report
+
+    with tempfile.TemporaryDirectory() as dir:
+        # У каждого теста свой файл вывода, пути готовим заранее
+        output_files = [os.path.join(dir, f'output_{i}.txt') for i in range(len(tests))]
+        tasks = [
+            asyncio.create_task(run_test(i, test, output_file))
+            for i, (test, output_file) in enumerate(zip(tests, output_files))
+        ]
+        processed = set()
+
+        try:
+            progress = tqdm(
+                asyncio.as_completed(tasks),
+                total=len(tasks),
+                desc='Running tests',
+                miniters=max(1, len(tasks) // 100),
+                mininterval=0.2,
+                smoothing=0
+            )
+            for next_result in progress:
+                index, test, test_result, report = await next_result
+                processed.add(index)
+
+                if test_result == 'OK':
+                    passed.add(index)
+                elif test_result is not None and dry_run:
+                    # WA, RE или TL
+                    if report:
+                        print(report)
+                    print(f'{test_result} on test {test.name}')
+
+                # Как и при последовательном запуске, сообщаем о первой по номеру ошибке,
+                # поэтому ждём завершения всех тестов перед ней
+                if failure is not None and all(i in processed for i in range(failure[0])):
+                    index, test, test_result, report = failure
+                    if report:
+                        print(report)
+                    print(f'{test_result} on test {test.name}')
+                    break
+        finally:
+            # Поток из to_thread нельзя отменить: ждём уже запущенные тесты,
+            # иначе временная директория удалится у них из-под ног
+            stop.set()
+            for index, task in enumerate(tasks):
+                if index not in started:
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    if results_key is not None:
+        _prune_cache(RESULTS_DIR, CACHE_MAX_RESULTS)
+
+    if failure is not None:
+        # Как при последовательном запуске: считаем только тесты до первой ошибки
+        return sum(1 for index in passed if index < failure[0])
+    return len(passed)
 
 
 def run_tests(
@@ -130,45 +495,15 @@ def run_tests(
     dry_run: bool=False,
     time_limit: float=1.0,
     start_from: int=1,
-    end_at: int=None
+    end_at: int=None,
+    use_cache: bool=True
 ):
-    passed_count = 0
-    
     if end_at is None:
         end_at = len(tests)
         
     tests = tests[start_from-1:end_at]
-    
-    with tempfile.TemporaryDirectory() as dir:
-        for test in tqdm(tests, desc='Running tests'):
-            output_file = str(Path(dir) / 'output.txt')
-            input_file = str(test / 'input.txt')
-            true_output_file = str(test / 'output.txt')
-
-            test_result = test_case(
-                test,
-                verbose,
-                input_file,
-                output_file,
-                true_output_file,
-                checker,
-                time_limit
-            )
 
-            if test_result == 'OK':
-                passed_count += 1
-            elif test_result == 'WA':
-                print(f'WA on test {test.name}')
-                if not dry_run:
-                    break
-            elif test_result == 'RE':
-                print(f'RE on test {test.name}')
-                if not dry_run:
-                    break
-            elif test_result == 'TL':
-                print(f'TL on test {test.name}')
-                if not dry_run:
-                    break
+    passed_count = asyncio.run(_run_tests(tests, checker, verbose, dry_run, time_limit, use_cache))
 
     if passed_count == len(tests):
         print('All tests passed')
@@ -176,10 +511,10 @@ def run_tests(
         print(passed_count, '/', len(tests), 'tests passed')
 
 
-def main(task_path: str, verbose: bool=False, skip_compiler_checks: bool=False, dry_run: bool=False, time_limit: float=1.0, start_from: int=1, end_at: int=None):
+def main(task_path: str, verbose: bool=False, skip_compiler_checks: bool=False, dry_run: bool=False, time_limit: float=1.0, start_from: int=1, end_at: int=None, use_cache: bool=True):
     task_path = Path(task_path)
 
-    if not compile(task_path, skip_compiler_checks):
+    if not compile(task_path, skip_compiler_checks, use_cache):
         return
 
     tests = get_tests(task_path)
@@ -196,10 +531,62 @@ def main(task_path: str, verbose: bool=False, skip_compiler_checks: bool=False,
         dry_run,
         time_limit,
         start_from,
-        end_at
+        end_at,
+        use_cache
     )
 
 
+def watch(task_path: str, *main_args):
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ImportError:
+        print('Watch mode requires watchdog: pip install watchdog')
+        return
+
+    task_path = Path(task_path).absolute()
+    watched_files = {task_path / 'main.cpp', task_path / 'checker.py'}
+    tests_dir = task_path / 'tests'
+    changed = threading.Event()
+
+    class ChangeHandler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            # Открытие файлов при запуске тестов тоже порождает события, их пропускаем
+            if event.event_type not in ('created', 'modified', 'moved', 'deleted'):
+                return
+
+            # Бинарник и main.flags перезаписываются при сборке, их изменения игнорируем
+            for path in (event.src_path, getattr(event, 'dest_path', '')):
+                if not path:
+                    continue
+                path = Path(path)
+                if path in watched_files or tests_dir in path.parents:
+                    changed.set()
+
+    observer = Observer()
+    observer.schedule(ChangeHandler(), str(task_path), recursive=True)
+    observer.start()
+    try:
+        while True:
+            try:
+                main(str(task_path), *main_args)
+            except Exception:
+                # Файлы могут быть сохранены не до конца, ждём следующего изменения
+                traceback.print_exc()
+            print('\nWaiting for changes... (Ctrl+C to exit)')
+            changed.wait()
+            # Редактор может сохранять файл в несколько приёмов, ждём пока события утихнут
+            changed.clear()
+            while changed.wait(WATCH_DEBOUNCE):
+                changed.clear()
+            print()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        observer.stop()
+        observer.join()
+
+
 if __name__ == "__main__":
     args = argparse.ArgumentParser(description="Run tests for task")
     args.add_argument(
@@ -243,6 +630,18 @@ if __name__ == "__main__":
         default=None,
         help="End testing at specific test number (default: last test)",
     )
+    args.add_argument(
+        '--cache',
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Reuse cached binaries and results of passed tests (default: enabled)",
+    )
+    args.add_argument(
+        '-w',
+        '--watch',
+        action=argparse.BooleanOptionalAction,
+        help="Rerun testing on every change of main.cpp, checker.py or tests (requires watchdog)",
+    )
 
     args = args.parse_args()
 
@@ -254,4 +653,8 @@ if __name__ == "__main__":
 /_/  |_/_/\__, /\____/_/  \___/____/\__/____/  
          /____/                                """, end='\n\n')
     
-    main(args.task, args.verbose, args.skip_compiler_checks, args.dry_run, args.time_limit, args.start_from, args.end_at)
\ No newline at end of file
+    main_args = (args.task, args.verbose, args.skip_compiler_checks, args.dry_run, args.time_limit, args.start_from, args.end_at, args.cache)
+    if args.watch:
+        watch(*main_args)
+    else:
+        main(*main_args)
\ No newline at end of file